@@ -18,10 +18,7 @@ class FilterStatus(Enum):
         :param string: The input string representing filter status.
         :return: The corresponding FilterStatus enum value.
         """
-        match string:
-            case "all":
-                return FilterStatus.ALL
-            case "active":
-                return FilterStatus.ACTIVE
-            case "completed":
-                return FilterStatus.COMPLETED
+        return _STR_TO_STATUS[string]
+
+
+_STR_TO_STATUS = {status.value: status for status in FilterStatus}
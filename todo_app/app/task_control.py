@@ -14,10 +14,32 @@ from todo_app.todo_logic.task import Task
 from .task_event import TaskEvent
 from .ui.task_ui import TaskUi
 
+_HHMM_LENGTH = 5
+"""Length of a zero-padded HH:MM time string."""
+
+_UNSET = object()
+"""Sentinel marking a value as never rendered (None is a legitimate rendered value)."""
+
+_DUE_DATE_LABEL = "Due date"
+_DUE_TIME_LABEL = "Due time"
+_ICON_CANCEL = icons.CANCEL_OUTLINED
+_ICON_CALENDAR = icons.CALENDAR_MONTH_OUTLINED
+_ICON_TIME = icons.ACCESS_TIME
+
 
 class TaskControl(TaskUi):
     """Represents a task for managing to-do items."""
 
+    __slots__ = (
+        "_is_complete",
+        "_last_rendered_date",
+        "_last_rendered_has_description",
+        "_last_rendered_time",
+        "_on_task_event",
+        "_pre_edit",
+        "_task",
+    )
+
     def __init__(
         self,
         task: Task,
@@ -29,20 +51,12 @@ class TaskControl(TaskUi):
         :param on_task_event: A callback function for handling task events.
         """
         super().__init__()
-        self._task = task
         self._on_task_event = on_task_event
 
         # Display elements
-        self._display_task.label = self._task.name
-        self._display_task.value = self._task.is_complete
         self._display_task.on_change = self._on_status_change
         self._edit_task_btn.on_click = self._on_edit_click
         self._delete_task_btn.on_click = self._on_delete_click
-        self._description_indicator.visible = self._task.description is not None
-        self._date_indicator_text.value = due_date.isoformat() if (due_date := self._task.due_date) else None
-        self._date_indicator.visible = self._task.due_date is not None
-        self._time_indicator_text.value = due_time.isoformat()[:5] if (due_time := self._task.due_time) else None
-        self._time_indicator.visible = self._task.due_time is not None
 
         # Edit elements
         self._date_picker.on_change = self._on_pick_date
@@ -51,6 +65,9 @@ class TaskControl(TaskUi):
         self._time_picker_btn.on_click = self._on_open_time_picker
         self._save_btn.on_click = self._on_save_click
 
+        self._task: Task
+        self.rebind(task)
+
     @property
     def task(self) -> Task:
         """Returns the Task instance responsible for managing the task logic.
@@ -59,57 +76,118 @@ class TaskControl(TaskUi):
         """
         return self._task
 
+    @property
+    def is_complete(self) -> bool:
+        """Get the completion status of the managed task, cached on the control.
+
+        :return: True if the task is complete, False otherwise.
+        """
+        return self._is_complete
+
+    @override
+    def __hash__(self) -> int:
+        """Override the hashing method.
+
+        :return: The precomputed hash of the managed task.
+        """
+        return hash(self._task)
+
+    def rebind(self, task: Task) -> None:
+        """Bind the control to a task, refreshing all displayed state.
+
+        Called on construction and when a pooled control is reused for a new task.
+
+        :param task: The task to display and manage.
+        """
+        self._task = task
+        self._is_complete: bool = task.is_complete
+        self._last_rendered_date: date | object | None = _UNSET
+        self._last_rendered_time: time | object | None = _UNSET
+        self._last_rendered_has_description: bool | None = None
+        self._pre_edit: tuple[str, str | None, date | None, time | None] | None = None
+        self._display_task.label = task.name
+        self._display_task.value = task.is_complete
+        self._update_description()
+        self._edit_name_field.value = ""
+        self._edit_description_field.value = ""
+        self._display_view.visible = True
+        self._edit_view.visible = False
+        self._update_date()
+        self._update_time()
+
     @override
     def update(self) -> None:
         """Update the task information and indicators.
 
         This method updates the description, date, and time of the task.
         """
-        self._description_indicator.visible = self._task.description is not None
-
+        self._update_description()
         self._update_date()
         self._update_time()
 
         super().update()
 
+    def _update_description(self) -> None:
+        """Update the description indicator visibility.
+
+        The write is skipped when the rendered state already matches the task.
+        """
+        if (has_description := self._task.description is not None) != self._last_rendered_has_description:
+            self._last_rendered_has_description = has_description
+            self._description_indicator.visible = has_description
+
     def _update_date(self) -> None:
         """Update the date information for the task.
 
         This method updates the due date text, icon, and visibility indicator.
+        The writes are skipped when the due date has not changed since the last render.
         """
-        if due_date := self._task.due_date:
-            self._date_picker_btn.text = due_date.isoformat()
-            self._date_picker_btn.icon = icons.CANCEL_OUTLINED
-            self._date_indicator_text.value = due_date.isoformat()
-            self._date_indicator.visible = True
+        if (due_date := self._task.due_date) == self._last_rendered_date:
+            return
+        self._last_rendered_date = due_date
+        date_picker_btn = self._date_picker_btn
+        date_indicator = self._date_indicator
+        if due_date_iso := self._task.due_date_iso:
+            date_picker_btn.text = due_date_iso
+            date_picker_btn.icon = _ICON_CANCEL
+            self._date_indicator_text.value = due_date_iso
+            date_indicator.visible = True
         else:
-            self._date_picker_btn.text = "Due date"
-            self._date_picker_btn.icon = icons.CALENDAR_MONTH_OUTLINED
-            self._date_indicator.visible = False
+            date_picker_btn.text = _DUE_DATE_LABEL
+            date_picker_btn.icon = _ICON_CALENDAR
+            date_indicator.visible = False
 
     def _update_time(self) -> None:
         """Update the time information for the task.
 
         This method updates the due time text, icon, and visibility indicator.
+        The writes are skipped when the due time has not changed since the last render.
         """
-        if due_time := self._task.due_time:
-            self._time_picker_btn.text = due_time.isoformat()[:5]
-            self._time_picker_btn.icon = icons.CANCEL_OUTLINED
-            self._time_indicator_text.value = due_time.isoformat()[:5]
-            self._time_indicator.visible = True
+        if (due_time := self._task.due_time) == self._last_rendered_time:
+            return
+        self._last_rendered_time = due_time
+        time_picker_btn = self._time_picker_btn
+        time_indicator = self._time_indicator
+        if due_time_hhmm := self._task.due_time_hhmm:
+            time_picker_btn.text = due_time_hhmm
+            time_picker_btn.icon = _ICON_CANCEL
+            self._time_indicator_text.value = due_time_hhmm
+            time_indicator.visible = True
         else:
-            self._time_picker_btn.text = "Due time"
-            self._time_picker_btn.icon = icons.ACCESS_TIME
-            self._time_indicator.visible = False
+            time_picker_btn.text = _DUE_TIME_LABEL
+            time_picker_btn.icon = _ICON_TIME
+            time_indicator.visible = False
 
     def _on_edit_click(self, _: ControlEvent) -> None:
         """Handle edit button click event.
 
         :param _: The control event object.
         """
-        self._edit_name_field.value = self._task.name
+        task = self._task
+        self._pre_edit = (task.name, task.description, task.due_date, task.due_time)
+        self._edit_name_field.value = task.name
         self._edit_name_field.focus()
-        if (description := self._task.description) is not None:
+        if (description := task.description) is not None:
             self._edit_description_field.value = description
         self._display_view.visible = False
         self._edit_view.visible = True
@@ -155,8 +233,12 @@ class TaskControl(TaskUi):
 
         :param _: The control event object.
         """
-        due_time = ":".join([x.zfill(2) for x in e.data.split(":")])
-        pick_time: time = time.fromisoformat(due_time)
+        try:
+            pick_time = time.fromisoformat(e.data if len(e.data) == _HHMM_LENGTH else e.data.zfill(_HHMM_LENGTH))
+        except ValueError:
+            # Fallback for unpadded components, with or without seconds ("H:MM", "9:30:00")
+            hour, minute = e.data.split(":")[:2]
+            pick_time = time(int(hour), int(minute))
         self._task.due_time = pick_time
         self.update()
 
@@ -175,11 +257,15 @@ class TaskControl(TaskUi):
         if not description:
             description = None
 
-        self._task.name = name
-        self._task.description = description
-        self._on_task_event(TaskEvent.MODIFY, self)
+        task = self._task
+        task.name = name
+        task.description = description
+        # Compare against the snapshot taken when edit mode was entered: the date
+        # and time pickers mutate the task directly, without firing an event.
+        if (name, description, task.due_date, task.due_time) != self._pre_edit:
+            self._on_task_event(TaskEvent.MODIFY, self)
 
-        self._display_task.label = name
+            self._display_task.label = name
 
         self._display_view.visible = True
         self._edit_view.visible = False
@@ -190,9 +276,11 @@ class TaskControl(TaskUi):
 
         :param _: The control event object.
         """
-        if (is_complete := self._display_task.value) is not None:
-            self._task.is_complete = is_complete
-            self._on_task_event(TaskEvent.SWITCH_COMPLETE, self)
+        if (is_complete := self._display_task.value) is None or is_complete == self._is_complete:
+            return
+        self._task.is_complete = is_complete
+        self._is_complete = is_complete
+        self._on_task_event(TaskEvent.SWITCH_COMPLETE, self)
 
     def _on_delete_click(self, _: ControlEvent) -> None:
         """Handle delete button click event.
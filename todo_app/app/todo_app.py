@@ -1,5 +1,10 @@
 """Module representing a Todo App user control with task management functionality."""
 
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
 from typing import override
 
 from flet import (
@@ -14,6 +19,12 @@ from .task_control import TaskControl
 from .task_event import TaskEvent
 from .ui.todo_app_ui import TodoAppUi
 
+_UPDATE_DEBOUNCE_INTERVAL = 0.016
+"""Trailing debounce interval (one frame) for coalescing bursts of update requests."""
+
+_TASK_CONTROL_POOL_LIMIT = 32
+"""Maximum number of deleted TaskControl instances kept for reuse."""
+
 
 class TodoAppControl(TodoAppUi):
     """A class representing a Todo App user control."""
@@ -25,42 +36,45 @@ class TodoAppControl(TodoAppUi):
         self.filter.on_change = self._on_tab_change
 
         self.task_manager = TaskManager()
+        self._task_controls: list[TaskControl] = []
+        # Ordered (insertion-order dict) buckets used as the controls list per filter
+        self._active: dict[TaskControl, None] = {}
+        self._completed: dict[TaskControl, None] = {}
+        self._buckets: dict[FilterStatus, Iterable[TaskControl]] = {
+            FilterStatus.ALL: self._task_controls,
+            FilterStatus.ACTIVE: self._active,
+            FilterStatus.COMPLETED: self._completed,
+        }
+        self._current_filter: FilterStatus = FilterStatus.ALL
+        self._update_timer: threading.Timer | None = None
+        self._update_timer_lock = threading.Lock()
+        self._persistence_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persistence")
+        self._task_control_pool: list[TaskControl] = []
+        self._dispatch: dict[TaskEvent, Callable[[TaskControl], None]] = {
+            TaskEvent.MODIFY: self._handle_modify,
+            TaskEvent.SWITCH_COMPLETE: self._handle_switch_complete,
+            TaskEvent.DELETE: self._handle_delete,
+        }
         self._load_tasks()
 
     def _load_tasks(self) -> None:
         """Load tasks from a file during initialization.
 
-        This method loads tasks using the TaskManager and creates TaskUi objects for each task to update the UI.
+        This method creates TaskControl objects for the tasks the TaskManager already loaded on construction.
         """
-        self.task_manager.load_tasks()
-        for task in self.task_manager.tasks:
-            task_ui = TaskControl(task, self._on_task_event)
-            self.task_list.controls.append(task_ui)
+        controls = [TaskControl(task, self._on_task_event) for task in self.task_manager.tasks]
+        self._task_controls.extend(controls)
+        for task_ui in controls:
+            (self._completed if task_ui.is_complete else self._active)[task_ui] = None
+        self.task_list.controls.extend(controls)
 
     @override
     def update(self) -> None:
         """Update the screen with changes based on selected filter status.
 
-        Method checks the filter status and updates the visibility of tasks accordingly.
+        Method swaps the task list contents to the bucket matching the filter status.
         """
-        if not (tabs := self.filter.tabs):
-            return
-        filter_index = self.filter.selected_index if self.filter.selected_index else 0
-
-        if isinstance(status := tabs[filter_index].text, str) and status in {"all", "active", "completed"}:  # type: ignore[reportUnknownMemberType] (Bad library typing)
-            status = FilterStatus.from_str(status)  # type: ignore[reportArgumentType] (The string has been verified)
-        else:
-            return
-
-        for task_ui in self.task_list.controls:
-            if not isinstance(task_ui, TaskControl):
-                continue
-            task_ui.visible = (
-                status == FilterStatus.ALL
-                or (status == FilterStatus.ACTIVE and task_ui.task.is_complete is False)
-                or (status == FilterStatus.COMPLETED and task_ui.task.is_complete)
-            )
-
+        self.task_list.controls = list(self._buckets[self._current_filter])
         super().update()
 
     def _on_add_click(self, _: ControlEvent) -> None:
@@ -70,14 +84,22 @@ class TodoAppControl(TodoAppUi):
         """
         if not self.new_task_field.value:
             return
-        task_ui = TaskControl(
-            Task(self.new_task_field.value),
-            self._on_task_event,
-        )
-        if self.task_manager.add_task(task_ui.task):
-            self.task_list.controls.append(task_ui)
-            self.new_task_field.value = ""
-            self.update()
+        task = Task(self.new_task_field.value)
+        if self._task_control_pool:
+            task_ui = self._task_control_pool.pop()
+            task_ui.rebind(task)
+        else:
+            task_ui = TaskControl(task, self._on_task_event)
+        self._task_controls.append(task_ui)
+        self._active[task_ui] = None
+        self.new_task_field.value = ""
+
+        def rollback() -> None:
+            self._task_controls.remove(task_ui)
+            _ = self._active.pop(task_ui, None)
+
+        self._persist(self.task_manager.add_task, task_ui.task, rollback=rollback)
+        self.update()
 
     def _on_task_event(self, task_event: TaskEvent, task_ui: TaskControl) -> None:
         """Handle a task event by modifying tasks in the TaskManager and updating the UI.
@@ -85,28 +107,135 @@ class TodoAppControl(TodoAppUi):
         :param task_event: The TaskEvent that occurred for the task.
         :param task_ui: The TaskUi object associated with the task.
         """
-        task = task_ui.task
-        match task_event:
-            case TaskEvent.MODIFY:
-                result = self.task_manager.modify_task(
-                    task_id=task.task_id,
-                    name=task.name,
-                    description=task.description,
-                    due_date=task.due_date,
-                    due_time=task.due_time,
-                )
-            case TaskEvent.SWITCH_COMPLETE:
-                result = self.task_manager.modify_task(task.task_id, is_complete=task.is_complete)
-            case TaskEvent.DELETE:
-                result = self.task_manager.delete_task(task.task_id)
-                if result:
-                    self.task_list.controls.remove(task_ui)
-        if result:
+        with self.batch_updates():
+            self._dispatch[task_event](task_ui)
             self.update()
 
+    def _handle_modify(self, task_ui: TaskControl) -> None:
+        """Persist the modified attributes of a task.
+
+        :param task_ui: The TaskControl associated with the modified task.
+        """
+        task = task_ui.task
+        self._persist(
+            self.task_manager.modify_task,
+            task_id=task.task_id,
+            name=task.name,
+            description=task.description,
+            due_date=task.due_date,
+            due_time=task.due_time,
+        )
+
+    def _handle_switch_complete(self, task_ui: TaskControl) -> None:
+        """Move a toggled task between the completion indexes and persist the change.
+
+        :param task_ui: The TaskControl associated with the toggled task.
+        """
+        is_complete = task_ui.is_complete
+        source, destination = (self._active, self._completed) if is_complete else (self._completed, self._active)
+        _ = source.pop(task_ui, None)
+        destination[task_ui] = None
+
+        def rollback() -> None:
+            task = task_ui.task
+            task.is_complete = not is_complete
+            task_ui.rebind(task)
+            _ = destination.pop(task_ui, None)
+            source[task_ui] = None
+
+        self._persist(self.task_manager.modify_task, task_ui.task.task_id, is_complete=is_complete, rollback=rollback)
+
+    def _handle_delete(self, task_ui: TaskControl) -> None:
+        """Remove a deleted task from the UI and persist the deletion.
+
+        :param task_ui: The TaskControl associated with the deleted task.
+        """
+        self._task_controls.remove(task_ui)
+        _ = self._active.pop(task_ui, None)
+        _ = self._completed.pop(task_ui, None)
+        pooled = len(self._task_control_pool) < _TASK_CONTROL_POOL_LIMIT
+        if pooled:
+            self._task_control_pool.append(task_ui)
+
+        def rollback() -> None:
+            if pooled:
+                try:
+                    self._task_control_pool.remove(task_ui)
+                except ValueError:
+                    return  # Already rebound to another task; the row cannot be restored.
+            self._task_controls.append(task_ui)
+            (self._completed if task_ui.is_complete else self._active)[task_ui] = None
+
+        self._persist(self.task_manager.delete_task, task_ui.task.task_id, rollback=rollback)
+
+    def _persist(
+        self,
+        operation: Callable[..., bool],
+        /,
+        *args: object,
+        rollback: Callable[[], None] | None = None,
+        **kwargs: object,
+    ) -> None:
+        """Run a TaskManager operation on the background persistence thread.
+
+        The UI is updated optimistically before the call; the single worker keeps
+        writes ordered while the event handler returns immediately. When the
+        operation raises or reports failure, the optimistic change is rolled back.
+
+        :param operation: The TaskManager method performing the disk write.
+        :param args: Positional arguments for the operation.
+        :param rollback: Callback undoing the optimistic UI change on failure.
+        :param kwargs: Keyword arguments for the operation.
+        """
+        future = self._persistence_executor.submit(operation, *args, **kwargs)
+        future.add_done_callback(partial(self._on_persist_done, rollback))
+
+    def _on_persist_done(self, rollback: Callable[[], None] | None, future: "Future[bool]") -> None:
+        """Handle the outcome of a persistence operation.
+
+        On success this is a no-op; on an exception or a False result the
+        optimistic UI change is undone and the screen refreshed. Exceptions are
+        re-raised so the executor surfaces them instead of swallowing them.
+
+        :param rollback: Callback undoing the optimistic UI change, if any.
+        :param future: The completed future of the TaskManager operation.
+        """
+        error = future.exception()
+        if error is None and future.result():
+            return
+        if rollback is not None:
+            rollback()
+        self.update()
+        if error is not None:
+            raise error
+
+    def _schedule_update(self) -> None:
+        """Schedule a trailing debounced update.
+
+        Rapid successive calls cancel the pending timer and reschedule, so a burst
+        of events collapses into a single update; the final event always flushes.
+        """
+        with self._update_timer_lock:
+            if self._update_timer is not None:
+                self._update_timer.cancel()
+            self._update_timer = threading.Timer(_UPDATE_DEBOUNCE_INTERVAL, self._flush_update)
+            self._update_timer.daemon = True
+            self._update_timer.start()
+
+    def _flush_update(self) -> None:
+        """Perform the debounced update scheduled by _schedule_update."""
+        with self._update_timer_lock:
+            self._update_timer = None
+        self.update()
+
     def _on_tab_change(self, _: ControlEvent) -> None:
         """Handle the event when filter tab are changed.
 
         :param _: The control event object.
         """
-        self.update()
+        tabs = self.filter.tabs
+        filter_index = self.filter.selected_index if self.filter.selected_index else 0
+        if tabs:
+            with suppress(KeyError):
+                self._current_filter = FilterStatus.from_str(tabs[filter_index].text)  # type: ignore[reportUnknownMemberType] (Bad library typing)
+        self._schedule_update()
@@ -1,4 +1,5 @@
 """Module provides classes for handling task-related user interface components."""
 
+from .batch_update import BatchUpdateMixin
 from .task_ui import TaskUi
 from .todo_app_ui import TodoAppUi
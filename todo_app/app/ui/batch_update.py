@@ -0,0 +1,43 @@
+"""Module contains a mixin that coalesces nested control updates into a single flush."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from flet import UserControl
+
+
+class BatchUpdateMixin(UserControl):
+    """A mixin for UserControl subclasses that batches nested update() calls.
+
+    While a batch_updates() block is active, update() calls only mark the control
+    as dirty; the outermost block exit performs a single real update.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the batching state."""
+        super().__init__()  # type: ignore[reportUnknownMemberType] (Bad library typing)
+        self._update_depth = 0
+        self._dirty = False
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Suspend updates for the duration of the block and flush once on exit.
+
+        The context manager is reentrant: nested blocks only increase the depth,
+        and the single flush happens when the outermost block exits.
+        """
+        self._update_depth += 1
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+            if self._update_depth == 0 and self._dirty:
+                self._dirty = False
+                super().update()
+
+    def update(self) -> None:
+        """Update the control, or mark it dirty if a batch is active."""
+        if self._update_depth > 0:
+            self._dirty = True
+            return
+        super().update()
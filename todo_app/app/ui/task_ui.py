@@ -18,14 +18,18 @@ from flet import (
     TextField,
     TextThemeStyle,
     TimePicker,
-    UserControl,
     colors,
     icons,
     margin,
 )
 
+from .batch_update import BatchUpdateMixin
 
-class TaskUi(UserControl):
+_INDICATOR_ICON_SIZE = 15
+_DESCRIPTION_LABEL = "Description"
+
+
+class TaskUi(BatchUpdateMixin):
     """A class representing a user interface for managing tasks."""
 
     def __init__(self) -> None:
@@ -70,9 +74,14 @@ class TaskUi(UserControl):
         # Task name & complete checkbox
         self._display_task = Checkbox()
 
-        # Description indicator
-        description_indicator_icon = Icon(name=icons.DESCRIPTION_OUTLINED, size=15)
-        description_indicator_text = Text(value="Description", theme_style=TextThemeStyle.BODY_SMALL)
+        self._build_description_indicator()
+        self._build_date_indicator()
+        self._build_time_indicator()
+
+    def _build_description_indicator(self) -> None:
+        """Build the description indicator row."""
+        description_indicator_icon = Icon(name=icons.DESCRIPTION_OUTLINED, size=_INDICATOR_ICON_SIZE)
+        description_indicator_text = Text(value=_DESCRIPTION_LABEL, theme_style=TextThemeStyle.BODY_SMALL)
 
         self._description_indicator = Row(
             spacing=3,
@@ -82,8 +91,9 @@ class TaskUi(UserControl):
             ],
         )
 
-        # Date indicator
-        date_indicator_icon = Icon(name=icons.CALENDAR_MONTH_OUTLINED, size=15)
+    def _build_date_indicator(self) -> None:
+        """Build the due date indicator row."""
+        date_indicator_icon = Icon(name=icons.CALENDAR_MONTH_OUTLINED, size=_INDICATOR_ICON_SIZE)
 
         self._date_indicator_text = Text(
             style=TextThemeStyle.BODY_SMALL,
@@ -97,8 +107,9 @@ class TaskUi(UserControl):
             ],
         )
 
-        # Time indicator
-        time_indicator_icon = Icon(name=icons.ACCESS_TIME, size=15)
+    def _build_time_indicator(self) -> None:
+        """Build the due time indicator row."""
+        time_indicator_icon = Icon(name=icons.ACCESS_TIME, size=_INDICATOR_ICON_SIZE)
 
         self._time_indicator_text = Text(
             style=TextThemeStyle.BODY_SMALL,
@@ -5,16 +5,18 @@ from typing import override
 from flet import (
     Column,
     FloatingActionButton,
+    ListView,
     Row,
     Tab,
     Tabs,
     TextField,
-    UserControl,
     icons,
 )
 
+from .batch_update import BatchUpdateMixin
 
-class TodoAppUi(UserControl):
+
+class TodoAppUi(BatchUpdateMixin):
     """A user interface control that displays tasks and allows users to interact with them."""
 
     def __init__(self) -> None:
@@ -22,7 +24,7 @@ class TodoAppUi(UserControl):
         super().__init__()  # type: ignore[reportUnknownMemberType] (Bad library typing)
         self.new_task_field = TextField(hint_text="Whats needs to be done?", expand=True, autofocus=True)
         self.add_task_button = FloatingActionButton(icon=icons.ADD)
-        self.task_list = Column()
+        self.task_list = ListView(expand=True)
 
         self.filter = Tabs(
             selected_index=0,
@@ -48,6 +50,7 @@ class TodoAppUi(UserControl):
 
         task_list_column = Column(
             spacing=25,
+            expand=True,
             controls=[
                 self.filter,
                 self.task_list,
@@ -56,6 +59,7 @@ class TodoAppUi(UserControl):
 
         return Column(
             width=600,
+            expand=True,
             controls=[
                 new_task_row,
                 task_list_column,
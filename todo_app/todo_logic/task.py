@@ -10,6 +10,19 @@ from .task_dict import TaskDict
 class Task:
     """Class representing a task with properties."""
 
+    __slots__ = (
+        "_description",
+        "_dict_cache",
+        "_due_date",
+        "_due_date_iso",
+        "_due_time",
+        "_due_time_hhmm",
+        "_hash",
+        "_is_complete",
+        "_name",
+        "_task_id",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         name: str,
@@ -32,8 +45,12 @@ class Task:
         self._description: str | None
         self._due_date: date | None
         self._due_time: time | None
+        self._due_date_iso: str | None
+        self._due_time_hhmm: str | None
+        self._dict_cache: TaskDict | None
         self._is_complete: bool
         self._task_id: str = task_id if task_id else str(uuid4())
+        self._hash: int = hash(self._task_id)
 
         if isinstance(due_date, str):
             due_date = date.fromisoformat(due_date)
@@ -56,19 +73,49 @@ class Task:
         """
         return cls(**adict)
 
+    @classmethod
+    def from_trusted_dict(cls, adict: TaskDict) -> "Task":
+        """Create a Task instance from already-validated persisted data.
+
+        Bypasses the validating property setters used by from_dict and assigns
+        attributes directly; only use for data previously produced by to_dict.
+
+        :param adict: Input dictionary to create the Task instance.
+
+        :return: A new Task instance created from the input dictionary.
+        """
+        self = cls.__new__(cls)
+        self._name = adict["name"]
+        self._description = adict["description"]
+        due_date_iso = adict["due_date"]
+        self._due_date = date.fromisoformat(due_date_iso) if due_date_iso else None
+        self._due_date_iso = due_date_iso
+        due_time_iso = adict["due_time"]
+        self._due_time = time.fromisoformat(due_time_iso) if due_time_iso else None
+        self._due_time_hhmm = due_time_iso[:5] if due_time_iso else None
+        self._is_complete = adict["is_complete"]
+        self._dict_cache = adict
+        self._task_id = adict["task_id"]
+        self._hash = hash(self._task_id)
+        return self
+
     def to_dict(self) -> TaskDict:
         """Convert the Task instance to a dictionary.
 
+        The dictionary is cached and reused until a setter changes an attribute.
+
         :return: A dictionary representation of the Task instance.
         """
-        return {
-            "name": self._name,
-            "description": self._description,
-            "due_date": self._due_date.isoformat() if self._due_date else None,
-            "due_time": self._due_time.isoformat() if self._due_time else None,
-            "task_id": self._task_id,
-            "is_complete": self._is_complete,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "name": self._name,
+                "description": self._description,
+                "due_date": self._due_date.isoformat() if self._due_date else None,
+                "due_time": self._due_time.isoformat() if self._due_time else None,
+                "task_id": self._task_id,
+                "is_complete": self._is_complete,
+            }
+        return self._dict_cache
 
     @property
     def task_id(self) -> str:
@@ -99,6 +146,7 @@ class Task:
             msg = "The name of the task cannot be an empty string."
             raise ValueError(msg)
         self._name = str(value)
+        self._dict_cache = None
 
     @property
     def description(self) -> str | None:
@@ -122,6 +170,7 @@ class Task:
                 msg = "The description of the task cannot be an empty string."
                 raise ValueError(msg)
         self._description = value
+        self._dict_cache = None
 
     @property
     def due_date(self) -> date | None:
@@ -138,6 +187,20 @@ class Task:
         :param value: The new due date for the task.
         """
         self._due_date = value
+        self._due_date_iso = None
+        self._dict_cache = None
+
+    @property
+    def due_date_iso(self) -> str | None:
+        """Get the due date of the task in ISO format.
+
+        The formatted string is computed lazily and cached until the due date changes.
+
+        :return: The due date as an ISO string, or None if not set.
+        """
+        if self._due_date_iso is None and self._due_date is not None:
+            self._due_date_iso = self._due_date.isoformat()
+        return self._due_date_iso
 
     @property
     def due_time(self) -> time | None:
@@ -154,6 +217,20 @@ class Task:
         :param value: The new due date for the task.
         """
         self._due_time = value
+        self._due_time_hhmm = None
+        self._dict_cache = None
+
+    @property
+    def due_time_hhmm(self) -> str | None:
+        """Get the due time of the task in HH:MM format.
+
+        The formatted string is computed lazily and cached until the due time changes.
+
+        :return: The due time as an HH:MM string, or None if not set.
+        """
+        if self._due_time_hhmm is None and self._due_time is not None:
+            self._due_time_hhmm = self._due_time.isoformat()[:5]
+        return self._due_time_hhmm
 
     @property
     def is_complete(self) -> bool:
@@ -170,6 +247,7 @@ class Task:
         :param value: The new completion status for the task.
         """
         self._is_complete = bool(value)
+        self._dict_cache = None
 
     @override
     def __repr__(self) -> str:
@@ -210,6 +288,6 @@ class Task:
     def __hash__(self) -> int:
         """Override the hashing method.
 
-        :return: Hash value based on the task_id of the object.
+        :return: Hash value precomputed from the task_id at construction.
         """
-        return hash(self.task_id)
+        return self._hash
@@ -2,59 +2,241 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import threading
+from contextlib import suppress
+from os import fstat
 from pathlib import Path
+from time import sleep
 from typing import TYPE_CHECKING
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from .task import Task
 
 if TYPE_CHECKING:
     from datetime import date, time
     from os import PathLike
+    from typing import BinaryIO
 
     from .task_dict import TaskDict
 
+_COMPACT_MIN_ENTRIES = 64
+"""Journal entries tolerated beyond twice the live task count before compaction."""
+
+_WRITE_BUFFER_SIZE = 65536
+"""Buffer size for journal rewrites, minimizing write syscalls on large files."""
+
+_FLUSH_INTERVAL = 0.1
+"""Seconds the background writer waits after the first pending entry, coalescing bursts."""
+
+_STREAM_PARSE_THRESHOLD = 1 << 20
+"""Legacy files larger than this (1MB) are parsed incrementally when ijson is available."""
+
+_SNIFF_SIZE = 16
+"""Bytes read to detect the legacy single-JSON-array format."""
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialize an object to JSON bytes with the fastest available encoder.
+
+    :param obj: The object to serialize.
+    :return: The JSON-encoded bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes) -> object:
+    """Parse JSON bytes with the fastest available decoder.
+
+    :param data: The JSON-encoded bytes.
+    :return: The parsed object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class TaskManager:
-    """A class to manage tasks."""
+    """A class to manage tasks.
+
+    Tasks are persisted in an append-only JSON-lines journal: every mutation
+    appends one `put`/`del` entry instead of rewriting the whole corpus, and the
+    journal is compacted back to one entry per live task when it grows too large.
+    """
 
     def __init__(self, path: PathLike[str] | None = None) -> None:
         """Initialize the TaskManager with the given file path.
 
         :param path: The path to the file where tasks will be stored.
         """
+        # The historical filename is kept so existing data files are picked up;
+        # the format is detected from the content, not the extension.
         self._path = Path(path) if path else Path("task_data.json")
         self._tasks: dict[str, Task] = {}
+        self._tasks_tuple: tuple[Task, ...] | None = None
+        self._save_list: list[TaskDict] = []
+        self._index: dict[str, int] = {}
+        self._journal_entries = 0
+        self._io_lock = threading.Lock()
+        self._pending: list[bytes] = []
+        self._dirty = threading.Event()
         self.load_tasks()
+        _ = atexit.register(self.flush)
+        self._writer = threading.Thread(target=self._writer_loop, name="task-journal-writer", daemon=True)
+        self._writer.start()
 
     @property
     def tasks(self) -> tuple[Task, ...]:
         """Get a tuple of all tasks stored in the TaskManager.
 
+        The tuple is cached and only rebuilt after the task set changes.
+
         :return: A tuple of Task objects representing all tasks.
         """
-        return tuple(self._tasks.values())
+        if self._tasks_tuple is None:
+            self._tasks_tuple = tuple(self._tasks.values())
+        return self._tasks_tuple
 
     def save_tasks(self) -> None:
-        """Save the tasks to the file specified by _path attribute."""
-        save_list = tuple(value.to_dict() for value in self._tasks.values())
-        with self._path.open("w") as f:
-            json.dump(save_list, f)
+        """Save the full task state to the file specified by _path attribute.
+
+        Equivalent to compacting the journal: the file is atomically rewritten
+        with one entry per live task.
+        """
+        self.compact()
+
+    def compact(self) -> None:
+        """Atomically rewrite the journal with one `put` entry per live task.
+
+        Pending entries are discarded since the snapshot already reflects them.
+        """
+        with self._io_lock:
+            self._pending.clear()
+            tmp_path = self._path.with_suffix(".tmp")
+            with tmp_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                for entry in self._save_list:
+                    _ = f.write(_dumps({"op": "put", "task": entry}) + b"\n")
+            _ = tmp_path.replace(self._path)
+            self._journal_entries = len(self._save_list)
+
+    def _append(self, entry: dict[str, object]) -> None:
+        """Queue a single journal entry for the background writer.
+
+        :param entry: The journal entry to append.
+        """
+        with self._io_lock:
+            self._pending.append(_dumps(entry) + b"\n")
+        self._dirty.set()
+
+    def _writer_loop(self) -> None:
+        """Coalesce pending journal entries and flush them in the background.
+
+        Waits for the first pending entry, then sleeps one flush interval so
+        rapid edits collapse into a single write.
+        """
+        while True:
+            self._dirty.wait()
+            sleep(_FLUSH_INTERVAL)
+            self._dirty.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all coalesced journal entries to disk.
+
+        Registered with atexit so pending entries are not lost on shutdown.
+        """
+        with self._io_lock:
+            if not self._pending:
+                return
+            appended = len(self._pending)
+            lines = b"".join(self._pending)
+            self._pending.clear()
+            with self._path.open("ab") as f:
+                _ = f.write(lines)
+            self._journal_entries += appended
+        if self._journal_entries > 2 * len(self._tasks) + _COMPACT_MIN_ENTRIES:
+            self.compact()
 
     def load_tasks(self) -> None:
         """Load tasks from the file specified by _path attribute.
 
-        If the file does not exist, do nothing.
+        If the file does not exist, do nothing. Both the journal format and the
+        legacy single-JSON-array format are accepted.
         """
-        if not (self._path.exists() and self._path.is_file()):
+        try:
+            file = self._path.open("rb")
+        except (FileNotFoundError, IsADirectoryError):
             return
+        with file:
+            prefix = file.read(_SNIFF_SIZE)
+            if prefix.lstrip().startswith(b"["):
+                _ = file.seek(0)
+                self._load_legacy(file)
+                return
+            data = prefix + file.read()
 
-        with self._path.open("r") as f:
+        self._tasks = {}
+        self._journal_entries = 0
+        for line in data.splitlines():
+            if not line:
+                continue
+            self._journal_entries += 1
             try:
-                tasks: list[TaskDict] = json.load(f)
-                self._tasks = {task["task_id"]: Task.from_dict(task) for task in tasks}
-            except json.JSONDecodeError:
-                self.save_tasks()
+                entry = _loads(line)
+            except ValueError:  # Both parsers raise JSONDecodeError subclasses of ValueError
+                continue
+            if not isinstance(entry, dict):
+                continue
+            match entry.get("op"):
+                case "put" if isinstance(task_dict := entry.get("task"), dict):
+                    task = Task.from_trusted_dict(task_dict)
+                    self._tasks[task.task_id] = task
+                case "del":
+                    _ = self._tasks.pop(entry.get("task_id"), None)
+                case _:
+                    pass
+        self._rebuild_save_list()
+
+    def _load_legacy(self, file: BinaryIO) -> None:
+        """Load tasks stored in the legacy single-JSON-array format.
+
+        The state is rewritten in journal format afterwards. Large files are
+        parsed incrementally from the file when ijson is available, keeping only
+        one task dict in flight instead of materializing the whole file in memory.
+
+        :param file: The open task file, positioned at the start.
+        """
+        if ijson is not None and fstat(file.fileno()).st_size > _STREAM_PARSE_THRESHOLD:
+            with suppress(ijson.JSONError):
+                self._tasks = {
+                    task.task_id: task
+                    for task_dict in ijson.items(file, "item")
+                    if (task := Task.from_trusted_dict(task_dict))
+                }
+        else:
+            with suppress(ValueError):
+                tasks: list[TaskDict] = _loads(file.read())  # type: ignore[assignment] (Trusted persisted data)
+                self._tasks = {task["task_id"]: Task.from_trusted_dict(task) for task in tasks}
+        self._rebuild_save_list()
+        self.compact()
+
+    def _rebuild_save_list(self) -> None:
+        """Rebuild the incrementally maintained save list and its id index."""
+        self._tasks_tuple = None
+        self._save_list = [task.to_dict() for task in self._tasks.values()]
+        self._index = {entry["task_id"]: i for i, entry in enumerate(self._save_list)}
 
     def add_task(self, task: Task) -> bool:
         """Add a new task to the task manager.
@@ -63,10 +245,15 @@ class TaskManager:
 
         :return: True if the task is successfully added, False otherwise.
         """
-        if self._tasks.get(task.task_id):
+        if task.task_id in self._tasks:
             return False
         self._tasks[task.task_id] = task
-        self.save_tasks()
+        self._tasks_tuple = None
+        entry = task.to_dict()
+        with self._io_lock:
+            self._index[task.task_id] = len(self._save_list)
+            self._save_list.append(entry)
+        self._append({"op": "put", "task": entry})
         return True
 
     def modify_task(  # noqa: PLR0913
@@ -89,21 +276,30 @@ class TaskManager:
 
         :return: True if the task is successfully modified, False otherwise.
         """
-        if task := self._tasks.get(task_id):
-            if name is not None:
-                task.name = name
-            if description is not None:
-                task.description = description
-            if due_date is not None:
-                task.due_date = due_date
-            if due_time is not None:
-                task.due_time = due_time
-            if is_complete is not None:
-                task.is_complete = is_complete
-            self._tasks[task_id] = task
-            self.save_tasks()
-            return True
-        return False
+        try:
+            task = self._tasks[task_id]
+        except KeyError:
+            return False
+        if name is not None:
+            task.name = name
+        if description is not None:
+            task.description = description
+        if due_date is not None:
+            task.due_date = due_date
+        if due_time is not None:
+            task.due_time = due_time
+        if is_complete is not None:
+            task.is_complete = is_complete
+        # Diff against the persisted snapshot, not the live task: callers may have
+        # already mutated the shared Task object before reaching this method.
+        entry = task.to_dict()
+        with self._io_lock:
+            index = self._index[task_id]
+            if self._save_list[index] == entry:
+                return True
+            self._save_list[index] = entry
+        self._append({"op": "put", "task": entry})
+        return True
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task from the task manager.
@@ -111,7 +307,14 @@ class TaskManager:
         :param task_id: The ID of the task to be deleted.
         :return: True if the task is successfully deleted, False otherwise.
         """
-        result = bool(self._tasks.pop(task_id))
+        result = self._tasks.pop(task_id, None) is not None
         if result:
-            self.save_tasks()
+            self._tasks_tuple = None
+            with self._io_lock:
+                index = self._index.pop(task_id)
+                last = self._save_list.pop()
+                if index < len(self._save_list):
+                    self._save_list[index] = last
+                    self._index[last["task_id"]] = index
+            self._append({"op": "del", "task_id": task_id})
         return result